@@ -1,58 +1,191 @@
-import json
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    # Fall back to the standard library parser if orjson isn't installed
+    from json import loads as json_loads
+import re
+import functools
+from collections import Counter
 import discord
 from discord import app_commands
 from discord.ext import commands
-from difflib import get_close_matches
-import traceback
+from rapidfuzz import process, fuzz
+import marisa_trie
+import ahocorasick
 import logging
 
 logger = logging.getLogger('discord')
 
+EMBED_COLOR = discord.Color.blue()
+HELP_COLOR = discord.Color.green()
+
+def _smws_code_key(code):
+    """Sort key giving natural ordering for SMWS codes (e.g. 2 < 10, G1 < G10)"""
+    prefix, number = re.match(r'([A-Za-z]*)(\d*)', code).groups()
+    return prefix.upper(), int(number) if number else 0, code
+
+def _truncate_field(text, limit=1024):
+    """Shorten text to fit in a Discord embed field value"""
+    if text and len(text) > limit:
+        return text[:limit - 3] + "..."
+    return text
+
+def _bigrams(text):
+    """Return the set of character bigrams in text"""
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
 class BrandCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         try:
-            self.brands = {}
-            self.distillery_codes = {}
             self.load_brands()
-            self.name_variants = {}
+            self.load_moreinfo()
             self.initialize_name_variants()
+            self.build_name_trie()
+            self.build_name_automaton()
+            self._help_embed = self._build_help_embed()
+            # Cog state is fixed after init, so lookups can be memoized per normalized name
+            self._find_cached = functools.lru_cache(maxsize=1024)(self._find_distillery_impl)
             logger.info(f"BrandCommands initialized with {len(self.brands)} codes")
         except Exception as e:
-            logger.error(f"Error in initialization: {str(e)}\n{traceback.format_exc()}")
+            logger.exception(f"Error in initialization: {e}")
             raise
 
+    def cog_unload(self):
+        self._find_cached.cache_clear()
+
+    def _build_help_embed(self):
+        """Build the static /help embed"""
+        embed = discord.Embed(
+            title="SMWS Bot Help",
+            description="How to use the SMWS Bot",
+            color=HELP_COLOR
+        )
+        embed.add_field(
+            name="/smws <code>",
+            value="Look up a distillery by its SMWS code\nExamples:\n`/smws 1` or `/smws G1` or `/smws R3`",
+            inline=False
+        )
+        embed.add_field(
+            name="/distillery <name>",
+            value="Look up the SMWS code for a distillery\nExample: `/distillery Highland Park`",
+            inline=False
+        )
+        embed.add_field(
+            name="Available Formats",
+            value="Distillery Codes: Various formats (23, 56, G1, R3, etc.)",
+            inline=False
+        )
+        embed.add_field(
+            name="More Info",
+            value="Check if Whiskord has additional info about a Distillery or Independent Bottler",
+            inline=False
+        )
+        return embed
+
     def load_brands(self):
         try:
             logger.debug("Attempting to load brands.json")
-            with open('/home/container/Bot2/data/brands.json', 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open('/home/container/Bot2/data/brands.json', 'rb') as f:
+                data = json_loads(f.read())
+            
+            # Build into locals and only swap them in once everything parsed, so a
+            # failed reload leaves the indexes already in use untouched
+            brands = {}
+            distillery_codes = {}
+            brand_by_upper_id = {}
+            # Struct-of-arrays view of brands.json, addressed through index_by_id
+            ids = []
+            regions = []
+            styles = []
+            details = []
+            index_by_id = {}
+            
+            for brand in data['brands']:
+                bid = str(brand['id'])
+                bid_upper = bid.upper()
+                brand_by_upper_id[bid_upper] = brand
+                
+                # Pre-truncate embed fields so /smws doesn't redo it on every request
+                if isinstance(brand.get('details'), dict):
+                    brand['_desc_trunc'] = _truncate_field(brand['details'].get('description'))
+                    brand['_notes_trunc'] = _truncate_field(brand['details'].get('notes'))
+                
+                index_by_id[bid] = len(ids)
+                ids.append(bid)
+                regions.append(brand.get('region', ''))
+                styles.append(brand.get('style', ''))
+                details.append(brand.get('details', {}))
+
+                brand_info = {
+                    'name': brand['name'],
+                    'details': brand.get('details', {}),
+                    'region': brand.get('region', ''),
+                    'style': brand.get('style', '')
+                }
                 
-                for brand in data['brands']:
-                    brand_info = {
-                        'name': brand['name'],
-                        'details': brand.get('details', {}),
-                        'region': brand.get('region', ''),
-                        'style': brand.get('style', '')
-                    }
-                    
-                    for code in brand['codes']:
-                        self.brands[str(code)] = brand_info.copy()
-                        if 'id' in brand and str(brand['id']) == str(code):
-                            self.brands[str(code)]['details'] = brand.get('details', {})
-                    
-                    distillery_name = brand['name'].lower()
-                    if distillery_name not in self.distillery_codes:
-                        self.distillery_codes[distillery_name] = set()
-                    self.distillery_codes[distillery_name].add(str(brand['id']))
+                # Brand info is read-only after loading, so every code shares the same dict
+                for code in brand['codes']:
+                    brands[str(code)] = brand_info
                 
-                logger.info(f"Loaded {len(self.brands)} codes for {len(self.distillery_codes)} distilleries")
+                distillery_name = brand['name'].lower()
+                if distillery_name not in distillery_codes:
+                    distillery_codes[distillery_name] = set()
+                distillery_codes[distillery_name].add(bid)
+            
+            # Codes are fixed after loading, so freeze them in display order
+            distillery_codes = {
+                name: tuple(sorted(codes, key=_smws_code_key))
+                for name, codes in distillery_codes.items()
+            }
+            
+            # Distillery names are stored lowercased, so rapidfuzz can match against them directly;
+            # a tuple lets every lookup share the same immutable sequence
+            all_names = tuple(distillery_codes)
+            
+            # Index names by character bigram to shortlist fuzzy match candidates
+            bigram_index = {}
+            for index, distillery_name in enumerate(all_names):
+                for bigram in _bigrams(distillery_name):
+                    bigram_index.setdefault(bigram, []).append(index)
         except Exception as e:
-            logger.error(f"Error loading brands: {str(e)}\n{traceback.format_exc()}")
+            logger.exception(f"Error loading brands: {e}")
             raise
+        
+        self.brands = brands
+        self.distillery_codes = distillery_codes
+        self._brand_by_upper_id = brand_by_upper_id
+        self._ids = ids
+        self._regions = regions
+        self._styles = styles
+        self._details = details
+        self._index_by_id = index_by_id
+        self._all_names = all_names
+        self._distillery_name_set = set(distillery_codes)
+        self._bigram_index = bigram_index
+        logger.info(f"Loaded {len(self.brands)} codes for {len(self.distillery_codes)} distilleries")
+
+    def reload_brands(self):
+        """Reload brands.json and rebuild everything derived from it"""
+        self.load_brands()
+        self.initialize_name_variants()
+        self.build_name_trie()
+        self.build_name_automaton()
+        self._find_cached.cache_clear()
+
+    def load_moreinfo(self):
+        try:
+            logger.debug("Attempting to load moreinfo.json")
+            with open('data/moreinfo.json', 'rb') as f:
+                self._moreinfo = json_loads(f.read())
+            logger.info(f"Loaded additional info for {len(self._moreinfo)} distilleries")
+        except Exception as e:
+            logger.exception(f"Error loading moreinfo: {e}")
+            self._moreinfo = {}
 
     def initialize_name_variants(self):
         """Initialize dictionary of name variants"""
+        self.name_variants = {}
         try:
             variants = {
                 "inverleven": ["leven", "inver"],
@@ -61,7 +194,7 @@ class BrandCommands(commands.Cog):
                 "few spirits": ["few"],
                 "isle of harris distillery": ["hearach"],
                 "nc'nean distillery": ["nc'nean"],
-                "st. georgeâ€™s (the english whisky co.)": ["st. georgeâ€™s", "the english whisky co.", "the english whisky company"],
+                "st. george’s (the english whisky co.)": ["st. george’s", "st. georges", "the english whisky co.", "the english whisky company"],
                 "springbank (hazelburn)": ["hazelburn"],
                 "isle of arran": ["arran"],
                 "braeval (braes of glenlivet)": ["braeval", "braes of glenlivet"],
@@ -80,24 +213,23 @@ class BrandCommands(commands.Cog):
                 "breuckelen distilling": ["breuckelen"],
                 "copperworks distilling Co.": ["copperworks"],
                 "high coast distillery": ["high coast"],
-                "smÃ¶gen whisky ab": ["smogen"],
+                "smögen whisky": ["smogen"],
                 "west cork distillers": ["west cork"],
                 "mosgaard whisky": ["mosgaard"],
                 "milk & honey distillery": ["milk & honey", "milk and honey"],
                 "distillerie de warenghem": ["warenghem", "armorik"],
                 "mars shinshu": ["shinshu"],
-                "mars tsunuki:": ["tsunuki"],
-                "nc'nean distillery": ["nc'nean"],
+                "mars tsunuki": ["tsunuki"],
                 "woodinville whiskey co.": ["woodinville"],
                 "finger lakes distilling": ["finger lakes"],
                 "new york distilling co.": ["new york distilling", "perry's tot", "new york"],
                 "peerless distillery": ["peerless"],
-                "kyrÃ¶ distillery": ["kyro"],
+                "kyrö distillery": ["kyro"],
                 "journeyman distillery": ["journeyman"],
-                "heaven hill distillery": ["heaven hill"],
+                "heaven hill": ["heaven hill distillery"],
                 "demerara distillers (el dorado)": ["demerara", "el dorado"],
                 "trinidad distillers (angostura)": ["trinidad", "angostura"],
-                "compaÃ±ia licorera de nicaragua (flor de caÃ±a)": ["flor de caÃ±a"],
+                "compañía licorera de nicaragua (flor de caña)": ["flor de caña", "flor de cana"],
                 "varela hermanos (ron abuelo)": ["ron abuelo"],
                 "j. goudoulin (veuve goudoulin)": ["goudoulin"],
                 "the borders distillery": ["borders", "the borders"],
@@ -107,47 +239,143 @@ class BrandCommands(commands.Cog):
                 # Add more variants as needed
             }
             
+            # Normalize everything to lowercase once so lookups never need to
+            variants_lc = {
+                main_name.lower(): [variant.lower() for variant in variant_list]
+                for main_name, variant_list in variants.items()
+            }
+            
             # Create reverse lookup for all variants
-            for main_name, variant_list in variants.items():
+            for canonical_name, variant_list in variants_lc.items():
+                if canonical_name not in self.distillery_codes:
+                    logger.warning(f"Name variant target '{canonical_name}' is not a known distillery")
                 for variant in variant_list:
-                    self.name_variants[variant.lower()] = main_name
+                    self.name_variants[variant] = canonical_name
                 # Also add the main name as its own variant
-                self.name_variants[main_name.lower()] = main_name
+                self.name_variants[canonical_name] = canonical_name
         except Exception as e:
             logger.error(f"Error initializing name variants: {e}")
 
+    def build_name_trie(self):
+        """Build a prefix trie over distillery names and their variants"""
+        self._name_trie = marisa_trie.Trie(
+            list(self.distillery_codes.keys()) + list(self.name_variants.keys())
+        )
+
+    def build_name_automaton(self):
+        """Build an Aho-Corasick automaton to spot known names inside longer queries"""
+        automaton = ahocorasick.Automaton()
+        resolved_keys = {}
+        for key in list(self.distillery_codes) + list(self.name_variants):
+            canonical_name = self._resolve_name(key)
+            if canonical_name:
+                automaton.add_word(key, (len(key), canonical_name))
+                resolved_keys[key] = canonical_name
+        automaton.make_automaton()
+        self._name_automaton = automaton
+        self._resolved_keys = resolved_keys
+        self._match_keys = tuple(resolved_keys)
+
+    def _resolve_name(self, key):
+        """Map a trie key (distillery name or variant) to its distillery name, if known"""
+        # Variants win over direct names, as in the exact-match path, so every stage agrees
+        canonical_name = self.name_variants.get(key)
+        if canonical_name in self._distillery_name_set:
+            return canonical_name
+        if key in self._distillery_name_set:
+            return key
+        return None
+
+    def _fuzzy_candidates(self, name_lower, limit=50):
+        """Shortlist the distillery names sharing the most character bigrams with the query"""
+        query_bigrams = _bigrams(name_lower)
+        # Short queries share too few bigrams to shortlist reliably, so score every name
+        if len(name_lower) < 5 or not query_bigrams:
+            return self._all_names
+        
+        overlap = Counter()
+        for bigram in query_bigrams:
+            overlap.update(self._bigram_index.get(bigram, ()))
+        # Keep the original name order so equal scores tie-break as they would over the full list
+        shortlist = sorted(index for index, _ in overlap.most_common(limit))
+        return [self._all_names[index] for index in shortlist]
+
     def find_distillery(self, name):
         """
-        Find the distillery by name, using exact match, name variants, or fuzzy matching.
+        Find the distillery by name, using exact match, name variants, prefix, substring or fuzzy matching.
 
         Args:
             name (str): The name of the distillery to search for.
 
         Returns:
-            tuple: A tuple containing the standardized distillery name and a list of SMWS codes,
+            tuple: A tuple containing the standardized distillery name and a sorted tuple of SMWS codes,
                    or (None, None) if no match is found.
         """
         logger.debug(f"🔍 Searching for distillery: {name}")
-        
-        name_lower = name.lower()
-        
+        return self._find_cached(name.lower())
+
+    def _find_distillery_impl(self, name_lower):
+        """Uncached lookup behind find_distillery; name_lower must already be lowercased"""
         # First check name variants
-        if name_lower in self.name_variants:
-            standardized_name = self.name_variants[name_lower]
-            if standardized_name.lower() in self.distillery_codes:
-                return standardized_name.lower(), list(self.distillery_codes[standardized_name.lower()])
+        canonical_name = self.name_variants.get(name_lower)
+        if canonical_name in self._distillery_name_set:
+            return canonical_name, self.distillery_codes[canonical_name]
         
         # Then check direct matches in distillery_codes
-        if name_lower in self.distillery_codes:
-            return name_lower, list(self.distillery_codes[name_lower])
+        if name_lower in self._distillery_name_set:
+            return name_lower, self.distillery_codes[name_lower]
+        
+        # Very short or purely numeric input can't be a distillery name, skip fuzzy matching
+        if len(name_lower) < 3 or name_lower.isdigit():
+            return None, None
+        
+        # Next try a prefix search, ranking multiple candidates by similarity
+        candidates = {
+            resolved for resolved in map(self._resolve_name, self._name_trie.keys(name_lower))
+            if resolved
+        }
+        if candidates:
+            if len(candidates) == 1:
+                closest_match = candidates.pop()
+            else:
+                # Rank a fixed ordering (shortest first) so equal scores resolve the same way every run
+                ordered = sorted(candidates, key=lambda n: (len(n), n))
+                closest_match = process.extractOne(name_lower, ordered, scorer=fuzz.WRatio)[0]
+            return closest_match, self.distillery_codes[closest_match]
+        
+        # A near-exact typo of a full name beats a shorter name found inside the query
+        match = process.extractOne(name_lower, self._match_keys, scorer=fuzz.ratio, score_cutoff=90)
+        if match:
+            closest_match = self._resolved_keys[match[0]]
+            return closest_match, self.distillery_codes[closest_match]
+        
+        # Then look for a known name or variant contained in the query, preferring the longest
+        best_match = None
+        for end, (length, canonical_name) in self._name_automaton.iter(name_lower):
+            start = end - length + 1
+            # Only accept whole-word hits, so "few" doesn't match inside "curfew"
+            if start > 0 and name_lower[start - 1].isalnum():
+                continue
+            if end + 1 < len(name_lower) and name_lower[end + 1].isalnum():
+                continue
+            if best_match is None or length > best_match[0]:
+                best_match = (length, canonical_name)
+        if best_match:
+            return best_match[1], self.distillery_codes[best_match[1]]
         
         # Finally, fall back to fuzzy matching only if no exact matches found
-        all_names = list(self.distillery_codes.keys())
-        suggestions = get_close_matches(name_lower, all_names, n=1, cutoff=0.6)
+        match = process.extractOne(
+            name_lower, self._fuzzy_candidates(name_lower), scorer=fuzz.ratio, score_cutoff=60
+        )
+        if not match:
+            # The shortlist can miss names with few shared bigrams, so retry against every name
+            match = process.extractOne(
+                name_lower, self._all_names, scorer=fuzz.ratio, score_cutoff=60
+            )
         
-        if suggestions:
-            closest_match = suggestions[0]
-            return closest_match, list(self.distillery_codes[closest_match])
+        if match:
+            closest_match = match[0]
+            return closest_match, self.distillery_codes[closest_match]
         
         return None, None
 
@@ -156,7 +384,7 @@ class BrandCommands(commands.Cog):
         try:
             logger.debug(f"SMWS command called with code: {code}")
             
-            # Defer FIRST, before any file operations
+            # Defer FIRST, before anything else
             try:
                 await interaction.response.defer()
                 logger.debug("Successfully deferred interaction")
@@ -164,33 +392,12 @@ class BrandCommands(commands.Cog):
                 logger.warning(f"Interaction expired before defer for code: {code}")
                 return
                 
-            try:
-                # Load the original JSON data to check IDs
-                with open('/home/container/Bot2/data/brands.json', 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    logger.debug(f"Successfully loaded brands.json")
-            except FileNotFoundError:
-                logger.error("brands.json file not found")
-                await interaction.followup.send(
-                    "Configuration file not found. Please contact the bot administrator.",
-                    ephemeral=True
-                )
-                return
-            except json.JSONDecodeError:
-                logger.error("Error decoding brands.json")
-                await interaction.followup.send(
-                    "Error reading configuration. Please contact the bot administrator.",
-                    ephemeral=True
-                )
-                return
-                
             # Normalize input code (remove spaces, convert to uppercase for consistency)
             lookup_code = code.strip().upper()
             logger.debug(f"Normalized lookup code: {lookup_code}")
             
             # Find the brand by ID, comparing in a case-insensitive way for alphanumeric IDs
-            brand = next((brand for brand in data['brands'] 
-                        if str(brand['id']).upper() == lookup_code), None)
+            brand = self._brand_by_upper_id.get(lookup_code)
             
             if not brand:
                 logger.debug(f"No brand found for code: {lookup_code}")
@@ -206,7 +413,7 @@ class BrandCommands(commands.Cog):
                 embed = discord.Embed(
                     title=f"SMWS Code {code}",
                     description=brand['name'],
-                    color=discord.Color.blue()
+                    color=EMBED_COLOR
                 )
                 
                 # Handle potential missing or invalid fields
@@ -216,28 +423,20 @@ class BrandCommands(commands.Cog):
                 if 'style' in brand and brand['style']:
                     embed.add_field(name="Style", value=brand['style'], inline=True)
                 
-                if 'details' in brand and isinstance(brand['details'], dict):
-                    if 'description' in brand['details'] and brand['details']['description']:
-                        # Truncate description if it's too long
-                        description = brand['details']['description']
-                        if len(description) > 1024:
-                            description = description[:1021] + "..."
-                        embed.add_field(
-                            name="Description",
-                            value=description,
-                            inline=False
-                        )
-                    
-                    if 'notes' in brand['details'] and brand['details']['notes']:
-                        # Truncate notes if they're too long
-                        notes = brand['details']['notes']
-                        if len(notes) > 1024:
-                            notes = notes[:1021] + "..."
-                        embed.add_field(
-                            name="Notes",
-                            value=notes,
-                            inline=False
-                        )
+                # Description and notes were truncated to Discord's field limit at load time
+                if brand.get('_desc_trunc'):
+                    embed.add_field(
+                        name="Description",
+                        value=brand['_desc_trunc'],
+                        inline=False
+                    )
+                
+                if brand.get('_notes_trunc'):
+                    embed.add_field(
+                        name="Notes",
+                        value=brand['_notes_trunc'],
+                        inline=False
+                    )
                 
                 if 'codes' in brand and isinstance(brand['codes'], (list, set)):
                     other_codes = [str(c) for c in brand['codes'] if str(c).upper() != lookup_code]
@@ -270,14 +469,14 @@ class BrandCommands(commands.Cog):
                     ephemeral=True
                 )
             except Exception as embed_err:
-                logger.error(f"Error creating/sending embed: {str(embed_err)}\n{traceback.format_exc()}")
+                logger.exception(f"Error creating/sending embed: {embed_err}")
                 await interaction.followup.send(
                     "There was an error formatting the results. Please try again later.",
                     ephemeral=True
                 )
             
         except Exception as e:
-            logger.error(f"Error in SMWS command: {str(e)}\n{traceback.format_exc()}")
+            logger.exception(f"Error in SMWS command: {e}")
             try:
                 await interaction.followup.send(
                     "An error occurred while processing your request.",
@@ -295,12 +494,20 @@ class BrandCommands(commands.Cog):
             distillery_name, codes = self.find_distillery(name)
             
             if not distillery_name or not codes:
-                all_names = list(self.distillery_codes.keys())
-                suggestions = get_close_matches(name.lower(), all_names, n=3, cutoff=0.5)
+                name_lower = name.lower()
+                suggestions = process.extract(
+                    name_lower, self._fuzzy_candidates(name_lower),
+                    scorer=fuzz.ratio, limit=3, score_cutoff=50
+                )
+                if not suggestions:
+                    suggestions = process.extract(
+                        name_lower, self._all_names,
+                        scorer=fuzz.ratio, limit=3, score_cutoff=50
+                    )
                 
                 if suggestions:
                     suggest_text = "Did you mean one of these?\n" + "\n".join(
-                        s.title() for s in suggestions
+                        s[0].title() for s in suggestions
                     )
                     await interaction.followup.send(
                         f"No exact match found for '{name}'\n\n{suggest_text}",
@@ -315,45 +522,39 @@ class BrandCommands(commands.Cog):
 
             embed = discord.Embed(
                 title=f"Distillery: {distillery_name.title()}",
-                color=discord.Color.blue()
+                color=EMBED_COLOR
             )
 
-            # Get information from each code's entry
-            # Load the original JSON data to get complete entries
-            with open('/home/container/Bot2/data/brands.json', 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            # Find all entries that match our codes
-            entries = [brand for brand in data['brands'] if str(brand['id']) in codes]
+            # Find the brand entries that match our codes
+            indices = [self._index_by_id[c] for c in codes if c in self._index_by_id]
             
             # Add basic info from first entry
-            first_entry = entries[0]
-            if 'region' in first_entry:
-                embed.add_field(name="Region", value=first_entry['region'], inline=True)
-            if 'style' in first_entry:
-                embed.add_field(name="Style", value=first_entry['style'], inline=True)
+            first = indices[0]
+            if self._regions[first]:
+                embed.add_field(name="Region", value=self._regions[first], inline=True)
+            if self._styles[first]:
+                embed.add_field(name="Style", value=self._styles[first], inline=True)
 
             # Add a field showing all related codes
             embed.add_field(
                 name="SMWS Codes",
-                value=", ".join(sorted(codes)),
+                value=", ".join(codes),
                 inline=False
             )
 
             # Add each unique description
-            for entry in entries:
-                if 'details' in entry and 'description' in entry['details']:
-                    code = str(entry['id'])
+            for index in indices:
+                if 'description' in self._details[index]:
                     embed.add_field(
-                        name=f"Details for code {code}",
-                        value=entry['details']['description'],
+                        name=f"Details for code {self._ids[index]}",
+                        value=self._details[index]['description'],
                         inline=False
                     )
 
             await interaction.followup.send(embed=embed)
 
         except Exception as e:
-            logger.error(f"Error in distillery command: {str(e)}\n{traceback.format_exc()}")
+            logger.exception(f"Error in distillery command: {e}")
             await interaction.followup.send(
                 "An error occurred while processing your request.",
                 ephemeral=True
@@ -380,11 +581,8 @@ class BrandCommands(commands.Cog):
                 )
                 return
 
-            # Load and check the moreinfo data
-            with open('data/moreinfo.json', 'r') as f:
-                details = json.load(f)
-            
-            info = details.get(distillery_name.lower())
+            # Check the cached moreinfo data
+            info = self._moreinfo.get(distillery_name.lower())
             
             if not info:
                 await interaction.followup.send(
@@ -395,7 +593,7 @@ class BrandCommands(commands.Cog):
 
             embed = discord.Embed(
                 title=f"{distillery_name.title()}",
-                color=discord.Color.blue()
+                color=EMBED_COLOR
             )
             
             for key, value in info.items():
@@ -429,27 +627,22 @@ class BrandCommands(commands.Cog):
         
             embed = discord.Embed(
                 title=f"Bot Permissions in {interaction.guild.name}",
-                color=discord.Color.blue()
+                color=EMBED_COLOR
             )
 
-            enabled = []
-            disabled = []
-            for perm, value in permissions:
-                if value:
-                    enabled.append(f"✅ {perm}")
-                else:
-                    disabled.append(f"❌ {perm}")
+            enabled = "\n".join(f"✅ {perm}" for perm, value in permissions if value)
+            disabled = "\n".join(f"❌ {perm}" for perm, value in permissions if not value)
 
             if enabled:
                 embed.add_field(
                     name="Enabled Permissions",
-                    value="\n".join(enabled),
+                    value=enabled,
                     inline=False
                 )
             if disabled:
                 embed.add_field(
                     name="Disabled Permissions",
-                    value="\n".join(disabled),
+                    value=disabled,
                     inline=False
                 )
 
@@ -473,32 +666,7 @@ class BrandCommands(commands.Cog):
             logger.debug(f"Help command called with name: {interaction.user.name}")
             await interaction.response.defer(thinking=True)  # Add this line to prevent timeout
             
-            embed = discord.Embed(
-                title="SMWS Bot Help",
-                description="How to use the SMWS Bot",
-                color=discord.Color.green()
-            )
-            embed.add_field(
-                name="/smws <code>",
-                value="Look up a distillery by its SMWS code\nExamples:\n`/smws 1` or `/smws G1` or `/smws R3`",
-                inline=False
-            )
-            embed.add_field(
-                name="/distillery <name>",
-                value="Look up the SMWS code for a distillery\nExample: `/distillery Highland Park`",
-                inline=False
-            )
-            embed.add_field(
-                name="Available Formats",
-                value="Distillery Codes: Various formats (23, 56, G1, R3, etc.)",
-                inline=False
-            )
-            embed.add_field(
-                name="More Info",
-                value="Check if Whiskord has additional info about a Distillery or Independent Bottler",
-                inline=False
-            )
-            await interaction.followup.send(embed=embed)
+            await interaction.followup.send(embed=self._help_embed)
 
         except Exception as e:
             logger.error(f"Error in help command: {e}")
@@ -1,4 +1,5 @@
 import os
+import functools
 try:
     from secrets import DISCORD_TOKEN, APPLICATION_ID
 except ImportError:
@@ -6,8 +7,9 @@ except ImportError:
     DISCORD_TOKEN = os.getenv('DISCORD_TOKEN')
     APPLICATION_ID = os.getenv('APPLICATION_ID')
 
+@functools.lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from secrets.py or environment variables"""
+    """Load configuration from secrets.py or environment variables (validated once, then cached)"""
     
     config = {
         'DISCORD_TOKEN': DISCORD_TOKEN,
@@ -1,66 +1,137 @@
 import os
 import asyncio
+import random
 import signal
 import discord
 from discord.ext import commands
-from config import DISCORD_TOKEN, APPLICATION_ID
+from config import load_config
+
+# The bot is driven by slash commands; legacy "!" prefix commands are opt-in because they
+# need message events and the privileged message content intent
+ENABLE_PREFIX_COMMANDS = os.getenv('ENABLE_PREFIX_COMMANDS') == '1'
 
 # Set up bot with necessary intents
 intents = discord.Intents.default()
-intents.message_content = True
+intents.messages = ENABLE_PREFIX_COMMANDS
+intents.message_content = ENABLE_PREFIX_COMMANDS
 intents.guilds = True
 
+# uvloop is a faster drop-in event loop; it isn't available on Windows
+if os.name != 'nt':
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
 import logging
-logging.basicConfig(level=logging.DEBUG)
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+if LOG_LEVEL not in logging.getLevelNamesMapping():
+    raise SystemExit(f"Invalid LOG_LEVEL: {LOG_LEVEL!r}")
+logging.basicConfig(level=LOG_LEVEL)
 logger = logging.getLogger('discord')
 
+# Validate configuration once at startup; a bad token or ID can't be fixed by retrying
+try:
+    CONFIG = load_config()
+    APPLICATION_ID = int(CONFIG['APPLICATION_ID'])
+except ValueError as e:
+    raise SystemExit(f"Invalid configuration: {e}")
+
 class SMWSBot(commands.Bot):
     def __init__(self):
         super().__init__(
             command_prefix='!',
             intents=intents,
-            application_id=int(APPLICATION_ID) if APPLICATION_ID else None
+            application_id=APPLICATION_ID,
+            # Nothing here needs guild member lists or old messages, so skip fetching and caching them.
+            # A guild that ever needs members can be fetched on demand with `await guild.chunk()`.
+            chunk_guilds_at_startup=False,
+            max_messages=None,
+            member_cache_flags=discord.MemberCacheFlags.none()
         )
         self.initial_extensions = ['cogs.brand_commands']
+        # The prefix is fixed, so match it with a single str.startswith instead of get_prefix
+        self._prefix_tuple = (self.command_prefix,)
+        self._work_q = None
+        self._workers = []
+        self.invite_link = None
 
     async def setup_hook(self):
         """Called when the bot is first setting up"""
+        # Run prefix commands on a small worker pool, off the gateway event dispatch
+        if ENABLE_PREFIX_COMMANDS:
+            self._work_q = asyncio.Queue(maxsize=1000)
+            self._workers = [
+                asyncio.create_task(self._worker(), name="smws-worker") for _ in range(4)
+            ]
+
+        loaded = []
+        failed = []
         for extension in self.initial_extensions:
             try:
                 await self.load_extension(extension)
-                print(f"Loaded extension: {extension}")
+                loaded.append(extension)
             except Exception as e:
-                print(f"Failed to load extension {extension}: {e}")
+                failed.append(f"{extension} ({e})")
+        log = logger.error if failed else logger.info
+        log("extensions loaded: %s failed: %s", loaded, failed)
 
         # Sync commands with Discord (globally)
         try:
-            print("Syncing commands globally...")
             commands = await self.tree.sync()
-            print(f"Successfully registered {len(commands)} commands globally")
-            for cmd in commands:
-                print(f"- /{cmd.name}: {cmd.description}")
+            logger.info("synced %d commands: %s", len(commands), [c.name for c in commands])
         except Exception as e:
-            print(f"Failed to sync commands: {e}")
+            logger.error(f"Failed to sync commands: {e}")
+
+    def enqueue_message(self, message):
+        """Queue a message for the command workers, dropping it if the queue is full"""
+        # No workers run unless prefix commands are enabled
+        if self._work_q is None:
+            return
+        # Skip anything that can't be a prefix command before it takes a queue slot
+        if not message.content.startswith(self._prefix_tuple):
+            return
+        try:
+            self._work_q.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning(f"Message queue full, dropped message {message.id}")
+
+    async def _worker(self):
+        """Process queued messages one at a time"""
+        while True:
+            message = await self._work_q.get()
+            try:
+                await asyncio.wait_for(self.process_commands(message), timeout=30)
+            except asyncio.TimeoutError:
+                logger.warning(f"Timed out processing message {message.id}")
+            except Exception as e:
+                logger.exception(f"Error processing message {message.id}: {e}")
+            finally:
+                self._work_q.task_done()
 
     async def close(self):
         """Properly close the bot and cleanup resources"""
-        print("Bot is shutting down...")
+        logger.info("Bot is shutting down...")
         try:
-            # Close all cogs properly
-            for cog_name in list(self.cogs.keys()):
-                await self.remove_cog(cog_name)
+            for worker in self._workers:
+                worker.cancel()
             
-            # Call parent close method
+            # commands.Bot.close unloads extensions and removes cogs (running cog_unload)
             await super().close()
-            print("Bot closed successfully")
+            logger.info("Bot closed successfully")
         except Exception as e:
-            print(f"Error during bot shutdown: {e}")
+            logger.error(f"Error during bot shutdown: {e}")
 
 bot = SMWSBot()
 
 @bot.event
 async def on_ready():
-    print(f'Bot is ready! Logged in as {bot.user.name} (ID: {bot.user.id})')
+    logger.info(f'Bot is ready! Logged in as {bot.user.name} (ID: {bot.user.id})')
+
+    # on_ready fires again after reconnects; only build and log the invite link once
+    if bot.invite_link is not None:
+        return
 
     # Generate invite link with proper scopes and permissions
     permissions = discord.Permissions(
@@ -70,86 +141,117 @@ async def on_ready():
         add_reactions=True,
         attach_files=True
     )
-    invite_link = (
+    bot.invite_link = (
         f"https://discord.com/oauth2/authorize"
         f"?client_id={bot.user.id}"
         f"&permissions={permissions.value}"
         f"&scope=bot+applications.commands"
     )
-    print(f"\nInvite bot using this link:\n{invite_link}")
+    logger.info(f"Invite bot using this link: {bot.invite_link}")
 
 @bot.event
 async def on_command_error(ctx, error):
     """Handle command errors"""
-    print(f"Command error: {error}")
+    logger.warning(f"Command error: {error}")
     if isinstance(error, commands.errors.CommandNotFound):
         return
     await ctx.send(f"An error occurred: {str(error)}")
 
+# Guild IDs already announced, so join events replayed on reconnect aren't logged twice
+_joined_guild_ids = set()
+
 @bot.event
 async def on_guild_join(guild):
     """Log when the bot joins a new server"""
-    print(f"Joined new server: {guild.name} (ID: {guild.id})")
-    try:
-        # Sync commands for the new guild
-        await bot.tree.sync()
-        print(f"Synced commands for {guild.name}")
-    except Exception as e:
-        print(f"Error syncing commands for {guild.name}: {e}")
+    if guild.id in _joined_guild_ids:
+        return
+    _joined_guild_ids.add(guild.id)
+    logger.info(f"Joined new server: {guild.name} (ID: {guild.id})")
+
+    # Commands are synced globally in setup_hook; a per-guild sync is only useful in development
+    if os.getenv('SYNC_GUILD_COMMANDS') == '1':
+        try:
+            # Every command is global, so copy them onto the guild before syncing it
+            guild_object = discord.Object(id=guild.id)
+            bot.tree.copy_global_to(guild=guild_object)
+            await bot.tree.sync(guild=guild_object)
+            logger.info(f"Synced commands for {guild.name}")
+        except Exception as e:
+            logger.error(f"Error syncing commands for {guild.name}: {e}")
+
+@bot.event
+async def on_guild_remove(guild):
+    """Forget a server the bot left, so a later re-join is handled again"""
+    _joined_guild_ids.discard(guild.id)
+    logger.info(f"Removed from server: {guild.name} (ID: {guild.id})")
 
 @bot.event
 async def on_message(message):
     if message.author == bot.user:
         return
 
-    logger.debug(f"Received message: {message.content}")  # Debug log
+    # Skip formatting message content entirely unless debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received message: %s", message.content)
+
+    bot.enqueue_message(message)
 
-    # Get the actual prefix (bot.command_prefix might be a callable)
-    prefixes = await bot.get_prefix(message)
-    if isinstance(prefixes, str):
-        prefixes = (prefixes,)
+def backoff_delay(attempt, base_delay, max_delay):
+    """Exponential backoff capped at max_delay, with up to 50% random jitter"""
+    return min(base_delay * (2 ** attempt), max_delay) * (1 + random.uniform(0, 0.5))
 
-    # If message starts with any valid prefix, process commands
-    if any(message.content.startswith(prefix) for prefix in prefixes):
-        await bot.process_commands(message)
-    else:
-        return  # Avoid unintentional interference
+def retry_after(error):
+    """Return the Retry-After delay in seconds sent with an HTTP error, if any"""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None) or {}
+    try:
+        return float(headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
 
 async def run_bot_with_retry():
     """Run the bot with exponential backoff on rate limit errors"""
     max_retries = 3
     base_delay = 300  # 5 minutes
+    max_delay = 1800  # 30 minutes
     
     for attempt in range(max_retries):
+        unrecoverable = False
         try:
-            print(f"Attempting to connect to Discord (attempt {attempt + 1}/{max_retries})")
-            await bot.start(DISCORD_TOKEN)
+            logger.info(f"Attempting to connect to Discord (attempt {attempt + 1}/{max_retries})")
+            await bot.start(CONFIG['DISCORD_TOKEN'])
             break  # If successful, break out of retry loop
             
+        except (KeyError, ValueError, discord.LoginFailure) as e:
+            # Configuration and credential errors won't go away on retry, so fail immediately
+            logger.critical(f"Unrecoverable error, not retrying: {e}")
+            unrecoverable = True
+            raise
         except discord.HTTPException as e:
             if '429' in str(e) or 'rate limit' in str(e).lower():
                 if attempt < max_retries - 1:
-                    delay = base_delay * (2 ** attempt)  # Exponential backoff
-                    print(f"Rate limited! Waiting {delay} seconds before retry...")
+                    # Prefer Discord's own Retry-After, otherwise back off exponentially
+                    delay = retry_after(e) or backoff_delay(attempt, base_delay, max_delay)
+                    logger.warning(f"Rate limited! Waiting {delay:.0f} seconds before retry...")
                     await asyncio.sleep(delay)
                     continue
                 else:
-                    print("Max retries reached. Rate limit persists.")
+                    logger.error("Max retries reached. Rate limit persists.")
                     raise
             else:
                 # For other HTTP exceptions, don't retry immediately
-                print(f"HTTP Exception: {e}")
+                logger.warning(f"HTTP Exception: {e}")
                 if attempt < max_retries - 1:
                     delay = base_delay
-                    print(f"Waiting {delay} seconds before retry...")
+                    logger.info(f"Waiting {delay} seconds before retry...")
                     await asyncio.sleep(delay)
                 else:
                     raise
         except Exception as e:
-            print(f"Unexpected error: {e}")
+            logger.error(f"Unexpected error: {e}")
             if attempt < max_retries - 1:
-                delay = base_delay * (2 ** attempt)
-                print(f"Retrying in {delay} seconds...")
+                delay = backoff_delay(attempt, base_delay, max_delay)
+                logger.info(f"Retrying in {delay:.0f} seconds...")
                 await asyncio.sleep(delay)
             else:
                 raise
@@ -157,61 +259,93 @@ async def run_bot_with_retry():
             # Ensure bot is properly closed after each attempt
             if not bot.is_closed():
                 await bot.close()
-                # Wait a bit after closing before next attempt
-                if attempt < max_retries - 1:
+                # Wait a bit after closing before next attempt, unless there won't be one
+                if attempt < max_retries - 1 and not unrecoverable:
                     await asyncio.sleep(30)
 
-def handle_shutdown(signum, frame):
-    """Handle shutdown signals gracefully"""
-    print(f"Received signal {signum}, shutting down...")
-    asyncio.create_task(shutdown())
+# Set once shutdown() starts so repeated signals don't run it concurrently
+_shutting_down = False
+# The first signal-triggered shutdown task, so amain can wait for its cleanup to finish
+_shutdown_task = None
 
-async def shutdown():
+async def shutdown(sig=None):
     """Graceful shutdown procedure"""
-    print("Shutting down bot...")
-    if not bot.is_closed():
-        await bot.close()
+    global _shutting_down
+    if sig is not None:
+        logger.info(f"Received signal {sig.name}, shutting down...")
+    if _shutting_down:
+        logger.info("Shutdown already in progress")
+        return
+    _shutting_down = True
     
-    # Cancel all running tasks
-    tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    logger.info("Shutting down bot...")
+    try:
+        if not bot.is_closed():
+            # Shield the close so an outer cancel can't interrupt the gateway disconnect
+            await asyncio.shield(bot.close())
+    except asyncio.CancelledError:
+        logger.warning("Shutdown cancelled while closing the bot")
+        raise
+    
+    # Cancel only our own smws-* background tasks; bot.close() already cleaned up discord.py's
+    # tasks, and amain itself is left running so it can wait for this cleanup
+    tasks = [
+        t for t in asyncio.all_tasks()
+        if t is not asyncio.current_task() and t.get_name().startswith("smws-")
+    ]
     for task in tasks:
         task.cancel()
     
-    await asyncio.gather(*tasks, return_exceptions=True)
+    if tasks:
+        _, pending = await asyncio.wait(tasks, timeout=30)
+        if pending:
+            logger.warning("tasks did not finish: %s", [t.get_name() for t in pending])
 
-def main():
-    # Set up signal handlers for graceful shutdown
-    if os.name != 'nt':  # Not Windows
-        signal.signal(signal.SIGTERM, handle_shutdown)
-        signal.signal(signal.SIGINT, handle_shutdown)
+def schedule_shutdown(sig):
+    """Run shutdown() as a task on the loop in response to a signal"""
+    global _shutdown_task
+    task = asyncio.create_task(shutdown(sig), name=f"signal-{sig.name}")
+    if _shutdown_task is None:
+        _shutdown_task = task
+
+async def amain():
+    """Install signal handlers on the running loop, then run the bot"""
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        if os.name != 'nt':
+            loop.add_signal_handler(sig, schedule_shutdown, sig)
+        else:
+            # Windows has no add_signal_handler, so hand the signal over to the loop thread
+            signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(
+                schedule_shutdown, signal.Signals(signum)
+            ))
     
-    # Run Discord bot with retry logic
+    # Run the bot as a separate smws-* task so shutdown() can cancel it without cancelling amain
+    runner = asyncio.create_task(run_bot_with_retry(), name="smws-runner")
     try:
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
+        await runner
+    except asyncio.CancelledError:
+        logger.info("Bot task cancelled during shutdown")
+    except KeyboardInterrupt:
+        # The signal handlers normally turn Ctrl+C into shutdown(); handle a stray interrupt the same way
+        logger.info("Bot shutdown requested")
+        await shutdown()
+    
+    # Don't return until shutdown() has finished its bounded wait, or asyncio.run would
+    # cancel it and then wait on the remaining tasks with no time limit
+    if _shutdown_task is not None:
+        await _shutdown_task
 
-        if loop and loop.is_running():
-            # If there's already a running event loop, create a task
-            task = loop.create_task(run_bot_with_retry())
-        else:
-            asyncio.run(run_bot_with_retry())
+def main():
+    # Run Discord bot with retry logic
+    try:
+        asyncio.run(amain())
     except KeyboardInterrupt:
-        print("Bot shutdown requested")
-        # Run shutdown procedure
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                loop.create_task(shutdown())
-            else:
-                asyncio.run(shutdown())
-        except:
-            pass
+        logger.info("Bot shutdown requested")
     except Exception as e:
-        print(f"Fatal error: {e}")
+        logger.critical(f"Fatal error: {e}")
     finally:
-        print("Bot has been shut down")
+        logger.info("Bot has been shut down")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file